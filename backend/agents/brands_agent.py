@@ -40,8 +40,14 @@ Example Usage:
     run_brands_agent()
 """
 
+import logging
+from typing import List, Optional
+
 from .task_run import record_task_start, record_task_end
-from core.supabase_storage import upload_file_bytes
+from core.models import TaskRun
+from core.supabase_storage import UploadItem, upload_file_bytes, upload_file_bytes_bulk
+
+logger = logging.getLogger(__name__)
 
 
 def run_brands_agent():
@@ -52,14 +58,40 @@ def run_brands_agent():
     - Update brand profiles with new data
     - Handle brand migration tasks
     - Clean up inactive brand data
+
+    Asset uploads queued during onboarding are flushed in a single bulk
+    request once all brands have been processed. The onboarding TaskRun is
+    only closed once that flush has completed.
     """
-    # TODO: Implement brand-related background tasks
-    pass
+    pending_uploads: List[UploadItem] = []
 
+    onboarding_run = process_brand_onboarding(pending_uploads=pending_uploads)
+
+    try:
+        public_urls = upload_file_bytes_bulk(pending_uploads)
+    except Exception as e:
+        record_task_end(onboarding_run, success=False, error=f"Asset upload failed: {str(e)}")
+        raise
 
-def process_brand_onboarding():
+    for public_url in public_urls:
+        logger.info("Uploaded default asset to: %s", public_url)
+    record_task_end(onboarding_run, success=True)
+
+    # TODO: Implement remaining brand-related background tasks
+
+
+def process_brand_onboarding(pending_uploads: Optional[List[UploadItem]] = None) -> TaskRun:
     """
     Process brands that are in onboarding state.
+
+    Args:
+        pending_uploads: Optional upload buffer. When provided, assets are
+            queued here for the caller to flush with upload_file_bytes_bulk()
+            instead of being uploaded inline, and the returned TaskRun is left
+            RUNNING for the caller to close once the flush has completed.
+
+    Returns:
+        TaskRun for this onboarding pass
     """
     task_run = record_task_start('brands_agent', {'action': 'process_onboarding'})
 
@@ -69,15 +101,22 @@ def process_brand_onboarding():
         # Placeholder Supabase upload for demonstration
         # This would upload a default brand asset during onboarding
         dummy_data = b'{"default_asset": "brand_logo_placeholder"}'
-        public_url = upload_file_bytes(
+        asset = UploadItem(
             bucket='brand-assets',
             path='default/logo.png',
             data=dummy_data,
             content_type='application/json'
         )
-        print(f"Uploaded default asset to: {public_url}")
+
+        if pending_uploads is not None:
+            pending_uploads.append(asset)
+            return task_run
+
+        public_url = upload_file_bytes(*asset)
+        logger.info("Uploaded default asset to: %s", public_url)
 
         record_task_end(task_run, success=True)
+        return task_run
 
     except Exception as e:
         record_task_end(task_run, success=False, error=str(e))
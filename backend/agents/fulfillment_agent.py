@@ -45,16 +45,55 @@ Example Usage:
         carrier='fedex',
         service_level='express'
     )
+
+    # Fulfill many orders under a single TaskRun
+    result = run_fulfillment_batch(order_ids=[order.uuid for order in orders])
 """
 
-from typing import Dict, Any, Optional
-import uuid
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+import math
+import secrets
+import time
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 from .task_run import record_task_start, record_task_end
-from core.supabase_storage import upload_file_bytes
+from core.supabase_storage import (
+    UploadItem,
+    get_public_url,
+    upload_file_bytes,
+    upload_file_bytes_bulk,
+)
+
+# Order lookups are memoized for the duration of a single run only, so a
+# batch that repeats an order ID reads it once and a later run always sees
+# fresh fulfillment status.
+_order_memo: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    'fulfillment_order_memo', default=None
+)
+
+
+@contextmanager
+def _order_cache_scope():
+    """Memoize order lookups for the duration of one fulfillment run."""
+    token = _order_memo.set({})
+    try:
+        yield
+    finally:
+        _order_memo.reset(token)
+
+
+def _order_cache_key(order_id: str) -> str:
+    return f"fulfillment:order:{order_id}"
 
 
+@_order_cache_scope()
 def run_fulfillment(
     order_id: str,
     carrier: Optional[str] = None,
@@ -93,7 +132,7 @@ def run_fulfillment(
         selected_carrier = carrier or _select_optimal_carrier(order_details)
         selected_service = service_level or _select_service_level(order_details, selected_carrier)
 
-        # Generate shipping label
+        # Generate shipping label (uploads it before we touch the order)
         label_result = _generate_shipping_label(
             order_details=order_details,
             carrier=selected_carrier,
@@ -126,23 +165,174 @@ def run_fulfillment(
             'task_run_id': task_run.id
         }
 
-        record_task_end(task_run, success=True, result=result)
+        record_task_end(task_run, success=True)
+        return result
+
+    except Exception as e:
+        return _handle_error(task_run, str(e), "FULFILLMENT_ERROR")
+
+
+@_order_cache_scope()
+def run_fulfillment_batch(
+    order_ids: List[str],
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Fulfill many orders under a single TaskRun.
+
+    Orders are loaded with one bulk query and all shipping labels are uploaded
+    together in a single upload_file_bytes_bulk() call. A failure on one order,
+    including a failed label upload, is reported in its result and does not
+    stop the rest of the batch. Repeated order IDs are fulfilled once.
+    """
+    # Deduplicate while keeping order so a repeated ID never ships twice
+    order_ids = list(dict.fromkeys(order_ids))
+
+    task_run = record_task_start('fulfillment_agent', {
+        'action': 'batch',
+        'count': len(order_ids),
+        'dry_run': dry_run
+    })
+
+    try:
+        orders = _get_orders_details(order_ids)
+        carriers = dict(zip(orders, _select_optimal_carriers(list(orders.values()))))
+        estimated_delivery = _estimated_delivery_date()
+        pending_uploads: List[UploadItem] = []
+        upload_result_indexes: List[int] = []  # results index for each pending upload
+        results = []
+
+        for order_id in order_ids:
+            if _is_order_already_fulfilled(order_id):
+                results.append(
+                    _batch_error(order_id, "Order already fulfilled", "ALREADY_FULFILLED")
+                )
+                continue
+
+            order_details = orders.get(order_id)
+            if not order_details:
+                results.append(_batch_error(order_id, "Order not found", "ORDER_NOT_FOUND"))
+                continue
+
+            address_validation = _validate_shipping_address(order_details['shipping_address'])
+            if not address_validation['valid']:
+                results.append(_batch_error(
+                    order_id,
+                    f"Invalid shipping address: {address_validation['error']}",
+                    "INVALID_ADDRESS"
+                ))
+                continue
+
+            selected_carrier = carriers[order_id]
+            selected_service = _select_service_level(order_details, selected_carrier)
+
+            label_result = _generate_shipping_label(
+                order_details=order_details,
+                carrier=selected_carrier,
+                service_level=selected_service,
+                dry_run=dry_run,
+                pending_uploads=pending_uploads,
+                estimated_delivery=estimated_delivery
+            )
+
+            if not label_result['success']:
+                results.append(
+                    _batch_error(order_id, label_result['error'], "LABEL_GENERATION_FAILED")
+                )
+                continue
+
+            if len(pending_uploads) > len(upload_result_indexes):
+                upload_result_indexes.append(len(results))
+
+            results.append({
+                'status': 'SUCCESS',
+                'order_id': order_id,
+                'tracking_number': label_result['tracking_number'],
+                'carrier': selected_carrier,
+                'service_level': selected_service,
+                'shipping_cost': label_result['shipping_cost'],
+                'label_url': label_result['label_url'],
+                'estimated_delivery': label_result.get('estimated_delivery')
+            })
+
+        # Flush every label in one bulk upload before touching order records;
+        # orders whose label failed to upload are reported and not updated
+        upload_outcomes = upload_file_bytes_bulk(pending_uploads, return_exceptions=True)
+        for index, outcome in zip(upload_result_indexes, upload_outcomes):
+            if isinstance(outcome, Exception):
+                results[index] = _batch_error(
+                    results[index]['order_id'],
+                    f"Label upload failed: {str(outcome)}",
+                    "LABEL_GENERATION_FAILED"
+                )
+
+        fulfilled = [r for r in results if r['status'] == 'SUCCESS']
+        if not dry_run:
+            _update_orders_fulfillment(fulfilled)
+
+        result = {
+            'status': 'SUCCESS',
+            'fulfilled_count': len(fulfilled),
+            'failed_count': len(results) - len(fulfilled),
+            'results': results,
+            'task_run_id': task_run.id
+        }
+
+        record_task_end(task_run, success=True)
         return result
 
     except Exception as e:
         return _handle_error(task_run, str(e), "FULFILLMENT_ERROR")
 
 
+# Pre-sized failure result templates; copying one is a single C-level copy
+# with no incremental dict growth
+_FAILED_RESULT = {'status': 'FAILED', 'error': None, 'error_type': None}
+_FAILED_ORDER_RESULT = {'status': 'FAILED', 'order_id': None, 'error': None, 'error_type': None}
+
+
+def _batch_error(order_id: str, error_message: str, error_type: str) -> Dict[str, Any]:
+    """Build a per-order failure entry for run_fulfillment_batch results."""
+    result = _FAILED_ORDER_RESULT.copy()
+    result['order_id'] = order_id
+    result['error'] = error_message
+    result['error_type'] = error_type
+    return result
+
+
 def _is_order_already_fulfilled(order_id: str) -> bool:
     """Check if order has already been fulfilled."""
+    memo = _order_memo.get()
+    memo_key = f"fulfilled:{order_id}"
+    if memo is not None and memo_key in memo:
+        return memo[memo_key]
+
     # TODO: Check actual order fulfillment status
     # order = Order.objects.get(id=order_id)
     # return order.fulfillment_status == 'fulfilled'
-    return False  # Mock - assume not fulfilled
+    fulfilled = False  # Mock - assume not fulfilled
+
+    if memo is not None:
+        memo[memo_key] = fulfilled
+    return fulfilled
 
 
 def _get_order_details(order_id: str) -> Optional[Dict[str, Any]]:
-    """Get order details needed for fulfillment."""
+    """Get order details needed for fulfillment, memoized per run."""
+    memo = _order_memo.get()
+    cache_key = _order_cache_key(order_id)
+    if memo is not None and cache_key in memo:
+        return memo[cache_key]
+
+    order_details = _fetch_order_details(order_id)
+
+    if memo is not None:
+        memo[cache_key] = order_details
+    return order_details
+
+
+def _fetch_order_details(order_id: str) -> Optional[Dict[str, Any]]:
+    """Load order details from the database."""
     # TODO: Fetch actual order data
     # order = Order.objects.select_related('shipping_address').get(id=order_id)
 
@@ -166,15 +356,36 @@ def _get_order_details(order_id: str) -> Optional[Dict[str, Any]]:
     }
 
 
+def _get_orders_details(order_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Get fulfillment details for many orders, keyed by order ID."""
+    # TODO: Fetch actual order data in a single query
+    # orders = Order.objects.filter(id__in=order_ids).select_related('shipping_address')
+
+    details = {}
+    for order_id in order_ids:
+        order_details = _get_order_details(order_id)
+        if order_details:
+            details[order_id] = order_details
+    return details
+
+
+_REQUIRED_ADDRESS_FIELD_ORDER = ('name', 'street1', 'city', 'state', 'zip', 'country')
+_REQUIRED_ADDRESS_FIELDS = frozenset(_REQUIRED_ADDRESS_FIELD_ORDER)
+
+
 def _validate_shipping_address(address: Dict[str, Any]) -> Dict[str, Any]:
     """Validate shipping address for deliverability."""
     # TODO: Implement actual address validation
     # Could use services like EasyPost, Shippo, or carrier APIs
 
-    required_fields = ['name', 'street1', 'city', 'state', 'zip', 'country']
-    missing_fields = [field for field in required_fields if not address.get(field)]
+    keys = address.keys()
+    bad_fields = (_REQUIRED_ADDRESS_FIELDS - keys) | {
+        field for field in _REQUIRED_ADDRESS_FIELDS & keys if not address[field]
+    }
 
-    if missing_fields:
+    if bad_fields:
+        # Only the failure path pays for reporting fields in a stable order
+        missing_fields = [field for field in _REQUIRED_ADDRESS_FIELD_ORDER if field in bad_fields]
         return {
             'valid': False,
             'error': f"Missing required fields: {', '.join(missing_fields)}"
@@ -187,6 +398,14 @@ def _validate_shipping_address(address: Dict[str, Any]) -> Dict[str, Any]:
     return {'valid': True}
 
 
+# Weight breakpoints (lbs) and the carrier for each bucket:
+# <= 1 lb -> usps (light), <= 10 lbs -> ups (medium), heavier -> fedex
+_CARRIER_WEIGHT_BREAKS = (1.0, 10.0)
+_CARRIERS_BY_WEIGHT = ('usps', 'ups', 'fedex')
+_CARRIER_WEIGHT_BREAKS_ARRAY = np.array(_CARRIER_WEIGHT_BREAKS, dtype=np.float64)
+_CARRIERS_BY_WEIGHT_ARRAY = np.array(_CARRIERS_BY_WEIGHT)
+
+
 def _select_optimal_carrier(order_details: Dict[str, Any]) -> str:
     """Select the optimal carrier based on order characteristics."""
     # TODO: Implement carrier selection logic based on:
@@ -196,14 +415,24 @@ def _select_optimal_carrier(order_details: Dict[str, Any]) -> str:
     # - Cost optimization
     # - Carrier availability
 
-    # Simple logic for now
+    # Simple logic for now: weight buckets only
     weight = order_details.get('weight_lbs', 0)
-    if weight > 10:
-        return 'fedex'  # Heavy packages
-    elif weight > 1:
-        return 'ups'    # Medium packages
-    else:
-        return 'usps'   # Light packages
+    return _CARRIERS_BY_WEIGHT[bisect_left(_CARRIER_WEIGHT_BREAKS, weight)]
+
+
+def _select_optimal_carriers(orders_details: List[Dict[str, Any]]) -> List[str]:
+    """
+    Select carriers for a batch of orders in one vectorized pass.
+
+    Equivalent to calling _select_optimal_carrier() per order.
+    """
+    weights = np.fromiter(
+        (order_details.get('weight_lbs', 0) for order_details in orders_details),
+        dtype=np.float64,
+        count=len(orders_details)
+    )
+    buckets = np.digitize(weights, _CARRIER_WEIGHT_BREAKS_ARRAY, right=True)
+    return _CARRIERS_BY_WEIGHT_ARRAY[buckets].tolist()
 
 
 def _select_service_level(order_details: Dict[str, Any], carrier: str) -> str:
@@ -217,13 +446,80 @@ def _select_service_level(order_details: Dict[str, Any], carrier: str) -> str:
     return 'ground'
 
 
+DELIVERY_ESTIMATE_DAYS = 3
+
+
+def _estimated_delivery_date() -> str:
+    """Estimated delivery date (ISO format), recomputed at most once a minute."""
+    return _estimated_delivery_for_minute(int(time.time()) // 60)
+
+
+@lru_cache(maxsize=1)
+def _estimated_delivery_for_minute(minute_bucket: int) -> str:
+    return (timezone.now() + timezone.timedelta(days=DELIVERY_ESTIMATE_DAYS)).date().isoformat()
+
+
+_CARRIER_CODES = {'fedex': 'FEDEX', 'ups': 'UPS', 'usps': 'USPS'}
+
+
+def _carrier_code(carrier: str) -> str:
+    """Upper-case carrier code used in tracking numbers and labels."""
+    return _CARRIER_CODES.get(carrier) or carrier.upper()
+
+
+def _tracking_suffix() -> str:
+    """Random 12-character upper-case hex suffix for tracking numbers."""
+    return secrets.token_hex(6).upper()
+
+
+# Carrier rates for a lane are stable for a while, so quotes are cached per
+# (carrier, origin zip3, destination zip3, half-pound weight bucket)
+RATE_QUOTE_CACHE_TTL = 60 * 15  # seconds
+
+
+def _origin_zip3() -> str:
+    return getattr(settings, 'FULFILLMENT_ORIGIN_ZIP', '')[:3]
+
+
+def _quote_rate(carrier: str, origin_zip3: str, dest_zip3: str, weight_lbs: float) -> Dict[str, Any]:
+    """Get a carrier rate quote, served from cache when the lane was quoted recently."""
+    weight_bucket = math.ceil(weight_lbs * 2)  # half-pound increments
+    cache_key = f"fulfillment:rate:{carrier}:{origin_zip3}:{dest_zip3}:{weight_bucket}"
+
+    quote = cache.get(cache_key)
+    if quote is None:
+        quote = _fetch_carrier_rate(carrier, origin_zip3, dest_zip3, weight_bucket / 2)
+        cache.set(cache_key, quote, RATE_QUOTE_CACHE_TTL)
+    return quote
+
+
+def _fetch_carrier_rate(carrier: str, origin_zip3: str, dest_zip3: str, weight_lbs: float) -> Dict[str, Any]:
+    """Request a rate quote from the carrier API."""
+    # TODO: Call actual carrier rating APIs
+    return {
+        'shipping_cost': 12.99,  # Mock cost
+        'transit_days': DELIVERY_ESTIMATE_DAYS
+    }
+
+
 def _generate_shipping_label(
     order_details: Dict[str, Any],
     carrier: str,
     service_level: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    pending_uploads: Optional[List[UploadItem]] = None,
+    estimated_delivery: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Generate shipping label through carrier API."""
+    """
+    Generate shipping label through carrier API.
+
+    When ``pending_uploads`` is provided the label PDF is queued there for a
+    trailing upload_file_bytes_bulk() call instead of being uploaded inline.
+    Batch callers pass a precomputed ``estimated_delivery`` date.
+    """
+    if estimated_delivery is None:
+        estimated_delivery = _estimated_delivery_date()
+
     try:
         # TODO: Integrate with actual carrier APIs
         # This would call FedEx, UPS, USPS APIs to generate labels
@@ -232,33 +528,47 @@ def _generate_shipping_label(
             # Return mock data for dry run
             return {
                 'success': True,
-                'tracking_number': f'MOCK_{uuid.uuid4().hex[:12].upper()}',
+                'tracking_number': f'MOCK_{_tracking_suffix()}',
                 'shipping_cost': 12.99,
                 'label_url': 'https://supabase.com/mock-label.pdf',
-                'estimated_delivery': (timezone.now() + timezone.timedelta(days=3)).date().isoformat()
+                'estimated_delivery': estimated_delivery
             }
 
+        # Rate quote (cached per carrier/lane/weight bucket)
+        rate = _quote_rate(
+            carrier=carrier,
+            origin_zip3=_origin_zip3(),
+            dest_zip3=order_details['shipping_address']['zip'][:3],
+            weight_lbs=order_details.get('weight_lbs', 0)
+        )
+
         # Mock carrier API call
-        tracking_number = f"{carrier.upper()}_{uuid.uuid4().hex[:12].upper()}"
+        tracking_number = f"{_carrier_code(carrier)}_{_tracking_suffix()}"
 
         # Generate mock label PDF
         label_pdf = _create_mock_label_pdf(order_details, tracking_number, carrier)
 
         # Upload label to Supabase
         label_filename = f"label_{order_details['order_id']}_{tracking_number}.pdf"
-        label_url = upload_file_bytes(
+        label_upload = UploadItem(
             bucket='fulfillment-labels',
             path=label_filename,
             data=label_pdf,
             content_type='application/pdf'
         )
 
+        if pending_uploads is not None:
+            pending_uploads.append(label_upload)
+            label_url = get_public_url(label_upload.bucket, label_upload.path)
+        else:
+            label_url = upload_file_bytes(*label_upload)
+
         return {
             'success': True,
             'tracking_number': tracking_number,
-            'shipping_cost': 12.99,  # Mock cost
+            'shipping_cost': rate['shipping_cost'],
             'label_url': label_url,
-            'estimated_delivery': (timezone.now() + timezone.timedelta(days=3)).date().isoformat()
+            'estimated_delivery': estimated_delivery
         }
 
     except Exception as e:
@@ -268,12 +578,9 @@ def _generate_shipping_label(
         }
 
 
-def _create_mock_label_pdf(order_details: Dict[str, Any], tracking_number: str, carrier: str) -> bytes:
-    """Create a mock shipping label PDF."""
-    # TODO: Generate actual PDF with proper formatting
-    # For now, return minimal PDF content
-
-    mock_pdf = f"""%PDF-1.4
+# Mock label PDF with fixed-width slots. The layout never changes, so it is
+# split once at import and each label only fills in the slot bytes.
+_LABEL_PDF_SOURCE = b"""%PDF-1.4
 1 0 obj
 << /Type /Catalog /Pages 2 0 R >>
 endobj
@@ -294,13 +601,13 @@ BT
 50 750 Td
 (Shipping Label) Tj
 0 -20 Td
-(Order: {order_details['order_id']}) Tj
+(Order: @order@) Tj
 0 -20 Td
-(Tracking: {tracking_number}) Tj
+(Tracking: @tracking@) Tj
 0 -20 Td
-(Carrier: {carrier.upper()}) Tj
+(Carrier: @carrier@) Tj
 0 -20 Td
-(To: {order_details['shipping_address']['name']}) Tj
+(To: @name@) Tj
 ET
 endstream
 endobj
@@ -317,9 +624,50 @@ trailer
 startxref
 550
 %%EOF
-""".encode('utf-8')
+"""
+
+# Slot widths in bytes; values are space-padded or truncated to fit
+_LABEL_SLOT_WIDTHS = (('order', 36), ('tracking', 32), ('carrier', 8), ('name', 48))
+
+
+def _compile_label_template():
+    """Split the label source at its @field@ markers into static segments."""
+    segments = []
+    rest = _LABEL_PDF_SOURCE
+    for field, _ in _LABEL_SLOT_WIDTHS:
+        head, _, rest = rest.partition(f"@{field}@".encode('ascii'))
+        segments.append(head)
+    segments.append(rest)
+    return tuple(segments)
+
+
+# Static bytes between slots: len(_LABEL_SEGMENTS) == len(_LABEL_SLOT_WIDTHS) + 1
+_LABEL_SEGMENTS = _compile_label_template()
 
-    return mock_pdf
+
+def _create_mock_label_pdf(order_details: Dict[str, Any], tracking_number: str, carrier: str) -> bytes:
+    """
+    Create a mock shipping label PDF.
+
+    The label is assembled with a single join of the precompiled segments and
+    slot values, so the only allocation is the final bytes object handed to
+    the uploader.
+    """
+    # TODO: Generate actual PDF with proper formatting
+    # For now, return minimal PDF content
+    values = (
+        order_details['order_id'],
+        tracking_number,
+        _carrier_code(carrier),
+        order_details['shipping_address']['name'],
+    )
+
+    parts = [_LABEL_SEGMENTS[0]]
+    for value, (_, width), segment in zip(values, _LABEL_SLOT_WIDTHS, _LABEL_SEGMENTS[1:]):
+        parts.append(str(value).encode('utf-8')[:width].ljust(width))
+        parts.append(segment)
+
+    return b''.join(parts)
 
 
 def _update_order_fulfillment(
@@ -330,24 +678,57 @@ def _update_order_fulfillment(
     shipping_cost: float
 ):
     """Update order with fulfillment information."""
-    # TODO: Update actual order record
-    # order = Order.objects.get(id=order_id)
-    # order.tracking_number = tracking_number
-    # order.carrier = carrier
-    # order.service_level = service_level
-    # order.shipping_cost = shipping_cost
-    # order.fulfillment_status = 'fulfilled'
-    # order.fulfilled_at = timezone.now()
-    # order.save()
-    pass
+    _update_orders_fulfillment([{
+        'order_id': order_id,
+        'tracking_number': tracking_number,
+        'carrier': carrier,
+        'service_level': service_level,
+        'shipping_cost': shipping_cost
+    }])
+
+
+def _update_orders_fulfillment(updates: List[Dict[str, Any]]):
+    """
+    Update many orders with fulfillment information in one bulk write.
+
+    Each update carries order_id, tracking_number, carrier, service_level and
+    shipping_cost.
+    """
+    if not updates:
+        return
+
+    # TODO: Update actual order records
+    # fulfilled_at = timezone.now()
+    # orders = [
+    #     Order(
+    #         id=update['order_id'],
+    #         tracking_number=update['tracking_number'],
+    #         carrier=update['carrier'],
+    #         service_level=update['service_level'],
+    #         shipping_cost=update['shipping_cost'],
+    #         fulfillment_status='fulfilled',
+    #         fulfilled_at=fulfilled_at,
+    #     )
+    #     for update in updates
+    # ]
+    # Order.objects.bulk_update(orders, [
+    #     'tracking_number', 'carrier', 'service_level', 'shipping_cost',
+    #     'fulfillment_status', 'fulfilled_at',
+    # ], batch_size=500)
+
+    # Record the new status so the rest of this run cannot ship these again
+    memo = _order_memo.get()
+    if memo is not None:
+        for update in updates:
+            memo.pop(_order_cache_key(update['order_id']), None)
+            memo[f"fulfilled:{update['order_id']}"] = True
 
 
 def _handle_error(task_run, error_message: str, error_type: str) -> Dict[str, Any]:
     """Handle fulfillment errors with proper logging."""
     record_task_end(task_run, success=False, error=f"{error_type}: {error_message}")
 
-    return {
-        'status': 'FAILED',
-        'error': error_message,
-        'error_type': error_type
-    }
+    result = _FAILED_RESULT.copy()
+    result['error'] = error_message
+    result['error_type'] = error_type
+    return result
@@ -172,6 +172,15 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Agent tasks vary widely in duration; only reserve one task per worker
+# process and ack after completion so short tasks are not queued behind a
+# long-running one, and tasks from a crashed worker are redelivered.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_TASK_ROUTES = {
+    'agents.fulfillment_agent.*': {'queue': 'fulfillment'},
+}
 
 # Redis
 REDIS_URL = env('REDIS_URL', default='redis://localhost:6379/1')
@@ -182,6 +191,9 @@ SHOPIFY_API_SECRET = env('SHOPIFY_API_SECRET', default='')
 SHOPIFY_API_VERSION = env('SHOPIFY_API_VERSION', default='2024-01')
 SHOPIFY_REDIRECT_URI = env('SHOPIFY_REDIRECT_URI', default='http://localhost:8000/api/shopify/callback')
 
+# Fulfillment
+FULFILLMENT_ORIGIN_ZIP = env('FULFILLMENT_ORIGIN_ZIP', default='')  # Ship-from ZIP used for rate quotes
+
 # LLM
 LLM_PROVIDER = env('LLM_PROVIDER', default='mock')  # mock, openai, anthropic
 LLM_API_KEY = env('LLM_API_KEY', default='')
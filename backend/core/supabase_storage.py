@@ -5,16 +5,28 @@ Provides helper functions to interact with Supabase Storage buckets
 for storing and retrieving files and assets.
 """
 
+import asyncio
 import os
+from typing import List, NamedTuple, Tuple, Union
+
+import httpx
 from supabase import create_client, Client
 
 
-def _get_supabase_client() -> Client:
+class UploadItem(NamedTuple):
+    """A pending upload queued for upload_file_bytes_bulk()."""
+    bucket: str
+    path: str
+    data: bytes
+    content_type: str
+
+
+def _get_supabase_credentials() -> Tuple[str, str]:
     """
-    Get configured Supabase client.
+    Read Supabase URL and service role key from the environment.
 
     Returns:
-        Configured Supabase client instance
+        Tuple of (url, key)
 
     Raises:
         ValueError: If required environment variables are not set
@@ -28,9 +40,38 @@ def _get_supabase_client() -> Client:
             "Please add them to your .env file."
         )
 
+    return url, key
+
+
+def _get_supabase_client() -> Client:
+    """
+    Get configured Supabase client.
+
+    Returns:
+        Configured Supabase client instance
+
+    Raises:
+        ValueError: If required environment variables are not set
+    """
+    url, key = _get_supabase_credentials()
     return create_client(url, key)
 
 
+def get_public_url(bucket: str, path: str) -> str:
+    """
+    Build the public URL for an object without a network round-trip.
+
+    Args:
+        bucket: Name of the Supabase Storage bucket
+        path: Path within the bucket
+
+    Returns:
+        Public URL of the object
+    """
+    url, _ = _get_supabase_credentials()
+    return f"{url.rstrip('/')}/storage/v1/object/public/{bucket}/{path}"
+
+
 def upload_file_bytes(bucket: str, path: str, data: bytes, content_type: str) -> str:
     """
     Upload raw bytes to a Supabase Storage bucket.
@@ -65,6 +106,76 @@ def upload_file_bytes(bucket: str, path: str, data: bytes, content_type: str) ->
     return public_url
 
 
+def upload_file_bytes_bulk(
+    items: List[UploadItem],
+    jobs: int = 8,
+    return_exceptions: bool = False
+) -> List[Union[str, Exception]]:
+    """
+    Upload many objects concurrently over a single pooled HTTP client.
+
+    Requests are issued against the Storage REST API with at most ``jobs``
+    uploads in flight, so N uploads cost roughly N / jobs round-trips instead
+    of N.
+
+    This is a synchronous helper that drives its own event loop, so it must
+    not be called from code already running inside an event loop (e.g. an
+    async view); await the uploads there directly instead.
+
+    Args:
+        items: Pending uploads to flush
+        jobs: Maximum number of concurrent uploads
+        return_exceptions: If True, a failed upload is returned in place of
+            its URL instead of raising, so callers can handle it per item
+
+    Returns:
+        Public URLs of the uploaded files (or exceptions), in the same order
+        as ``items``
+
+    Raises:
+        RuntimeError: If called from a running event loop
+        Exception: If any upload fails and ``return_exceptions`` is False
+    """
+    if not items:
+        return []
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "upload_file_bytes_bulk() cannot be called from a running event loop"
+        )
+
+    url, key = _get_supabase_credentials()
+    base_url = url.rstrip('/')
+    headers = {'Authorization': f'Bearer {key}', 'apikey': key}
+
+    async def _upload_all() -> List[str]:
+        semaphore = asyncio.Semaphore(jobs)
+        limits = httpx.Limits(max_connections=jobs, max_keepalive_connections=jobs)
+
+        async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30.0) as client:
+            async def _upload(item: UploadItem) -> str:
+                async with semaphore:
+                    response = await client.post(
+                        f"{base_url}/storage/v1/object/{item.bucket}/{item.path}",
+                        content=item.data,
+                        headers={'Content-Type': item.content_type},
+                    )
+                if response.status_code != 200:
+                    raise Exception(f"Failed to upload file {item.path}: {response.text}")
+                return f"{base_url}/storage/v1/object/public/{item.bucket}/{item.path}"
+
+            return await asyncio.gather(
+                *(_upload(item) for item in items),
+                return_exceptions=return_exceptions
+            )
+
+    return asyncio.run(_upload_all())
+
+
 def download_file_bytes(bucket: str, path: str) -> bytes:
     """
     Download file bytes from a Supabase Storage bucket.
@@ -0,0 +1,38 @@
+"""
+Tests for brands agent
+"""
+import pytest
+from unittest.mock import patch
+
+from agents.brands_agent import run_brands_agent
+from core.models import TaskRun
+
+
+@pytest.mark.django_db
+class TestBrandsAgent:
+    """Test brand onboarding automation"""
+
+    @patch('agents.brands_agent.upload_file_bytes_bulk')
+    def test_deferred_upload_closes_task_run_after_flush(self, mock_upload_bulk):
+        """Test that the onboarding TaskRun succeeds only after the bulk flush"""
+        mock_upload_bulk.return_value = ['https://supabase.com/default/logo.png']
+
+        run_brands_agent()
+
+        mock_upload_bulk.assert_called_once()
+        assert len(mock_upload_bulk.call_args[0][0]) == 1
+        task_run = TaskRun.objects.get(agent_name='brands_agent')
+        assert task_run.status == 'SUCCESS'
+        assert task_run.end_time is not None
+
+    @patch('agents.brands_agent.upload_file_bytes_bulk')
+    def test_failed_flush_marks_task_run_failed(self, mock_upload_bulk):
+        """Test that a failed bulk flush is recorded on the onboarding TaskRun"""
+        mock_upload_bulk.side_effect = Exception("Storage unavailable")
+
+        with pytest.raises(Exception, match="Storage unavailable"):
+            run_brands_agent()
+
+        task_run = TaskRun.objects.get(agent_name='brands_agent')
+        assert task_run.status == 'FAILED'
+        assert 'Asset upload failed' in task_run.error_message
@@ -0,0 +1,136 @@
+"""
+Tests for fulfillment agent
+"""
+import pytest
+import uuid
+from unittest.mock import patch
+
+from agents.fulfillment_agent import run_fulfillment, run_fulfillment_batch
+
+
+@pytest.mark.django_db
+class TestFulfillmentAgent:
+    """Test fulfillment functionality"""
+
+    @patch('agents.fulfillment_agent.upload_file_bytes')
+    def test_successful_fulfillment(self, mock_upload):
+        """Test successful single-order fulfillment"""
+        mock_upload.return_value = 'https://supabase.com/label.pdf'
+
+        order_id = str(uuid.uuid4())
+        result = run_fulfillment(order_id=order_id)
+
+        assert result['status'] == 'SUCCESS'
+        assert result['order_id'] == order_id
+        assert result['carrier'] == 'ups'  # 2.5 lbs mock order
+        assert result['label_url'] == 'https://supabase.com/label.pdf'
+        assert 'task_run_id' in result
+        mock_upload.assert_called_once()
+
+    @patch('agents.fulfillment_agent._update_order_fulfillment')
+    @patch('agents.fulfillment_agent.upload_file_bytes')
+    def test_label_upload_failure(self, mock_upload, mock_update):
+        """Test that a failed label upload fails fulfillment without updating the order"""
+        mock_upload.side_effect = Exception("Storage unavailable")
+
+        result = run_fulfillment(order_id=str(uuid.uuid4()))
+
+        assert result['status'] == 'FAILED'
+        assert result['error_type'] == 'LABEL_GENERATION_FAILED'
+        assert 'Storage unavailable' in result['error']
+        mock_update.assert_not_called()
+
+    @patch('agents.fulfillment_agent.upload_file_bytes')
+    def test_dry_run_skips_upload(self, mock_upload):
+        """Test that dry runs never upload labels"""
+        result = run_fulfillment(order_id=str(uuid.uuid4()), dry_run=True)
+
+        assert result['status'] == 'SUCCESS'
+        assert result['tracking_number'].startswith('MOCK_')
+        mock_upload.assert_not_called()
+
+    @patch('agents.fulfillment_agent.get_public_url')
+    @patch('agents.fulfillment_agent.upload_file_bytes_bulk')
+    def test_batch_fulfillment_uploads_once(self, mock_upload_bulk, mock_public_url):
+        """Test that a batch uploads all labels in a single bulk call"""
+        mock_public_url.return_value = 'https://supabase.com/label.pdf'
+
+        order_ids = [str(uuid.uuid4()) for _ in range(3)]
+        result = run_fulfillment_batch(order_ids=order_ids)
+
+        assert result['status'] == 'SUCCESS'
+        assert result['fulfilled_count'] == 3
+        assert result['failed_count'] == 0
+        assert [r['order_id'] for r in result['results']] == order_ids
+        mock_upload_bulk.assert_called_once()
+        assert len(mock_upload_bulk.call_args[0][0]) == 3
+
+    @patch('agents.fulfillment_agent._update_orders_fulfillment')
+    @patch('agents.fulfillment_agent.get_public_url')
+    @patch('agents.fulfillment_agent.upload_file_bytes_bulk')
+    def test_batch_upload_failure_only_fails_affected_order(
+        self, mock_upload_bulk, mock_public_url, mock_update
+    ):
+        """Test that one failed label upload does not fail the rest of the batch"""
+        mock_public_url.return_value = 'https://supabase.com/label.pdf'
+        mock_upload_bulk.return_value = [
+            'https://supabase.com/label.pdf',
+            Exception("Storage unavailable"),
+            'https://supabase.com/label.pdf',
+        ]
+
+        order_ids = [str(uuid.uuid4()) for _ in range(3)]
+        result = run_fulfillment_batch(order_ids=order_ids)
+
+        assert result['status'] == 'SUCCESS'
+        assert result['fulfilled_count'] == 2
+        assert result['failed_count'] == 1
+        failed = result['results'][1]
+        assert failed['order_id'] == order_ids[1]
+        assert failed['error_type'] == 'LABEL_GENERATION_FAILED'
+        assert 'Storage unavailable' in failed['error']
+        updated = [u['order_id'] for u in mock_update.call_args[0][0]]
+        assert updated == [order_ids[0], order_ids[2]]
+
+    @patch('agents.fulfillment_agent._fetch_order_details')
+    def test_repeated_order_lookup_is_cached(self, mock_fetch):
+        """Test that repeated lookups of the same order hit the database once"""
+        order_id = str(uuid.uuid4())
+        mock_fetch.return_value = {
+            'order_id': order_id,
+            'weight_lbs': 2.5,
+            'shipping_address': {
+                'name': 'John Doe',
+                'street1': '123 Main St',
+                'city': 'Anytown',
+                'state': 'CA',
+                'zip': '12345',
+                'country': 'US'
+            },
+        }
+
+        result = run_fulfillment_batch(order_ids=[order_id, order_id], dry_run=True)
+
+        assert result['fulfilled_count'] == 1
+        assert [r['order_id'] for r in result['results']] == [order_id]
+        mock_fetch.assert_called_once_with(order_id)
+
+    @patch('agents.fulfillment_agent._fetch_order_details')
+    def test_order_lookup_memo_does_not_outlive_run(self, mock_fetch):
+        """Test that each run reads the order afresh instead of reusing a prior run's memo"""
+        order_id = str(uuid.uuid4())
+        mock_fetch.return_value = None
+
+        run_fulfillment(order_id=order_id, dry_run=True)
+        run_fulfillment(order_id=order_id, dry_run=True)
+
+        assert mock_fetch.call_count == 2
+
+    def test_batch_carrier_selection_matches_scalar(self):
+        """Test that vectorized carrier selection agrees with per-order selection"""
+        from agents.fulfillment_agent import _select_optimal_carrier, _select_optimal_carriers
+
+        orders = [{'weight_lbs': w} for w in (0, 0.5, 1, 1.01, 10, 10.5, 50)]
+
+        assert _select_optimal_carriers(orders) == [_select_optimal_carrier(o) for o in orders]
+        assert _select_optimal_carriers(orders) == ['usps', 'usps', 'usps', 'ups', 'ups', 'fedex', 'fedex']
@@ -0,0 +1,80 @@
+"""
+Tests for Supabase Storage helpers
+"""
+import asyncio
+import os
+import pytest
+import httpx
+from unittest.mock import patch
+
+from core.supabase_storage import UploadItem, upload_file_bytes_bulk
+
+
+SUPABASE_ENV = {
+    'SUPABASE_URL': 'https://example.supabase.co',
+    'SUPABASE_SERVICE_ROLE_KEY': 'service-role-key',
+}
+
+
+def _patched_client(handler):
+    """Patch httpx.AsyncClient so requests go to an in-process handler."""
+    real_client = httpx.AsyncClient
+
+    def factory(*args, **kwargs):
+        kwargs['transport'] = httpx.MockTransport(handler)
+        return real_client(*args, **kwargs)
+
+    return patch('core.supabase_storage.httpx.AsyncClient', side_effect=factory)
+
+
+@patch.dict(os.environ, SUPABASE_ENV)
+def test_bulk_upload_returns_urls_in_order():
+    """Test that every item is uploaded and URLs keep the input order"""
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append((request.url.path, request.headers['content-type']))
+        return httpx.Response(200, json={'Key': request.url.path})
+
+    items = [
+        UploadItem('brand-assets', 'a/logo.png', b'a', 'image/png'),
+        UploadItem('fulfillment-labels', 'label_1.pdf', b'%PDF', 'application/pdf'),
+    ]
+
+    with _patched_client(handler):
+        urls = upload_file_bytes_bulk(items)
+
+    assert urls == [
+        'https://example.supabase.co/storage/v1/object/public/brand-assets/a/logo.png',
+        'https://example.supabase.co/storage/v1/object/public/fulfillment-labels/label_1.pdf',
+    ]
+    assert sorted(requests_seen) == [
+        ('/storage/v1/object/brand-assets/a/logo.png', 'image/png'),
+        ('/storage/v1/object/fulfillment-labels/label_1.pdf', 'application/pdf'),
+    ]
+
+
+@patch.dict(os.environ, SUPABASE_ENV)
+def test_bulk_upload_raises_on_failed_item():
+    """Test that a failed upload raises"""
+    def handler(request):
+        return httpx.Response(500, text='boom')
+
+    with _patched_client(handler):
+        with pytest.raises(Exception, match='Failed to upload file'):
+            upload_file_bytes_bulk([UploadItem('b', 'x.pdf', b'x', 'application/pdf')])
+
+
+def test_bulk_upload_with_no_items_makes_no_requests():
+    """Test that an empty flush is a no-op and needs no credentials"""
+    assert upload_file_bytes_bulk([]) == []
+
+
+@patch.dict(os.environ, SUPABASE_ENV)
+def test_bulk_upload_rejects_running_event_loop():
+    """Test that calling from inside an event loop fails clearly"""
+    async def call_from_loop():
+        upload_file_bytes_bulk([UploadItem('b', 'x.pdf', b'x', 'application/pdf')])
+
+    with pytest.raises(RuntimeError, match='running event loop'):
+        asyncio.run(call_from_loop())
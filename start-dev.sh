@@ -75,7 +75,7 @@ cd ..
 echo ""
 echo -e "${YELLOW}Starting Celery worker...${NC}"
 cd backend
-poetry run celery -A config worker -l info &
+poetry run celery -A config worker -l info -Q celery,fulfillment -O fair &
 CELERY_PID=$!
 echo -e "${GREEN}✓ Celery worker started (PID: $CELERY_PID)${NC}"
 cd ..